@@ -0,0 +1,321 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import pickle
+
+# Column types for the expected-losses CSV; the selection keys are stored as
+# categoricals and the industry-group columns are nullable because counties
+# can have fewer than five impacted groups
+CSV_DTYPES = {
+    'State': 'category',
+    'County': 'category',
+    'inundation_zone': 'category',
+    'Establishments': 'int32',
+    'Employment': 'int32',
+    'county_establishments': 'int32',
+    'county_employment': 'int32',
+    'baEMP': 'int32',
+    'wages_week': 'float32',
+    'sales_week': 'float32',
+    **{f'impacted_naics4_{i}': 'Int32' for i in range(1, 6)},
+    **{f'emp_naics4_{i}': 'Int32' for i in range(1, 6)},
+}
+
+# Only these columns are used by the app, so nothing else is read from disk
+NEEDED_COLS = list(CSV_DTYPES) + [f'impacted_indgrp_{i}' for i in range(1, 6)]
+
+# Bump whenever load_data or build_option_index change what they produce, so
+# pickled artifacts from an older version of the app are rebuilt
+ARTIFACT_VERSION = 6
+
+# Styling for the industry table; it never changes, so only the rows are rebuilt
+INDUSTRY_TABLE_STYLE = """
+<style>
+    .styled-table {
+        border-collapse: collapse;
+        margin: 15px 0;
+        font-size: 0.9em; /* Adjusted for better fit */
+        width: 100%;
+    }
+    .styled-table thead tr {
+        background-color: #f2f2f2;
+        color: #333;
+        text-align: left;
+    }
+    .styled-table th,
+    .styled-table td {
+        padding: 12px 15px;
+        border: 1px solid #ddd;
+    }
+    .styled-table td:nth-child(1), .styled-table td:nth-child(2), .styled-table td:nth-child(4) {
+        text-align: center;
+    }
+</style>
+"""
+
+# Folder holding the inundation map images
+MAP_DIR = "Inundation Maps"
+
+# --- Data Loading ---
+# Use st.cache_data to load data only once
+@st.cache_data
+def load_data(file_path):
+    """Loads the CSV data into a pandas DataFrame, via a Parquet copy when one is current."""
+    parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+    try:
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path):
+            df = pd.read_parquet(parquet_path, columns=NEEDED_COLS)
+        else:
+            # Load the new CSV file and keep a Parquet copy for the next cold start
+            df = pd.read_csv(file_path, engine='pyarrow', dtype_backend='numpy_nullable', usecols=NEEDED_COLS, dtype=CSV_DTYPES)
+            try:
+                df.to_parquet(parquet_path, compression='zstd', index=False)
+            except OSError:
+                # The data directory may be read-only when deployed
+                pass
+    except FileNotFoundError:
+        st.error(f"Error: The file '{file_path}' was not found. Please make sure it's in the correct directory.")
+        return None
+
+    # Store the selection keys as ordered categoricals whose categories are
+    # already sorted, so the option lists never need sorting again
+    for col in ('State', 'County', 'inundation_zone'):
+        df[col] = pd.Categorical(df[col], categories=sorted(df[col].dropna().unique()), ordered=True)
+
+    # --- Derived Columns ---
+    # Computed once for every row so the results block only has to read them
+    df['percent_establishments'] = (df['Establishments'] / df['county_establishments'] * 100).round().where(df['county_establishments'] > 0, 0).astype('int16')
+    df['percent_employment'] = (df['Employment'] / df['county_employment'] * 100).round().where(df['county_employment'] > 0, 0).astype('int16')
+    df['lost_wages_millions'] = (df['wages_week'] / 1_000_000).round(1).astype('float32')
+    df['lost_sales_millions'] = (df['sales_week'] / 1_000_000).round(1).astype('float32')
+
+    # Pack the five most-affected industry groups into one array per row so the
+    # table is built from three arrays instead of fifteen separate columns
+    emp_in_groups = df[[f'emp_naics4_{i}' for i in range(1, 6)]].to_numpy(dtype='float64', na_value=np.nan)
+    total_emp_in_zone = df['baEMP'].to_numpy()[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        emp_percent = np.where(total_emp_in_zone > 0, np.round(emp_in_groups / total_emp_in_zone * 100), 0)
+    df['industry_groups'] = list(df[[f'impacted_indgrp_{i}' for i in range(1, 6)]].to_numpy(dtype=object, na_value=None))
+    df['industry_naics'] = list(df[[f'impacted_naics4_{i}' for i in range(1, 6)]].to_numpy(dtype='int32', na_value=0))
+    df['industry_emp_percent'] = list(np.nan_to_num(emp_percent).astype('int16'))
+
+    # Index by the selection keys so each selection is a single hash lookup
+    return df.set_index(['State', 'County', 'inundation_zone'], drop=False).sort_index()
+
+def build_option_index(df):
+    """Builds lookup tables of the sorted selectbox options for each state and county.
+
+    Only called from get_artifacts, which caches the result. Relies on load_data
+    having sorted df by its ordered categorical index, so the unique values of
+    each group already come out in sorted order.
+    """
+    return {
+        'states': df['State'].cat.categories.tolist(),
+        'counties': df.groupby(level='State', observed=True)['County'].unique().apply(list).to_dict(),
+        'inundations': df.groupby(level=['State', 'County'], observed=True)['inundation_zone'].unique().apply(list).to_dict(),
+        # SLOSH category number used in the map file names, e.g. "Category 2 hurricane" -> "2"
+        'category_numbers': {zone: ''.join(filter(str.isdigit, zone)) for zone in df['inundation_zone'].unique()},
+        # Remove " County" from display titles for better readability
+        'display_counties': {county: county.replace(" County", "") for county in df['County'].unique()},
+    }
+
+def build_record_index(df):
+    """Maps each (State, County, inundation_zone) key to its row as a plain dict.
+
+    Only called from get_artifacts, which caches the result.
+    """
+    records = {}
+    for key, record in zip(df.index, df.to_dict('records')):
+        # Keep the first row when the spreadsheet repeats a selection
+        records.setdefault(key, record)
+    return records
+
+@st.cache_resource
+def get_artifacts(file_path):
+    """Returns the indexed DataFrame, its option index, and its row records, reusing a pickled copy across restarts."""
+    cache_path = os.path.splitext(file_path)[0] + ".pkl"
+    if os.path.exists(cache_path) and os.path.exists(file_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        try:
+            with open(cache_path, "rb") as f:
+                version, *artifacts = pickle.load(f)
+            if version == ARTIFACT_VERSION:
+                return tuple(artifacts)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            # Unreadable cache file; rebuild it below
+            pass
+
+    df = load_data(file_path)
+    if df is None:
+        return None, None, None
+
+    artifacts = (df, build_option_index(df), build_record_index(df))
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((ARTIFACT_VERSION, *artifacts), f, protocol=5)
+    except OSError:
+        # The data directory may be read-only when deployed
+        pass
+    return artifacts
+
+@st.cache_data
+def render_selection(file_path, state, county, zone):
+    """Builds the header, HTML blocks, and map details for one state/county/zone selection."""
+    _, options, records = get_artifacts(file_path)
+
+    # Look up the row for the user's selection
+    selection_data = records[(state, county, zone)]
+
+    # --- Extract Data ---
+    establishments = int(selection_data['Establishments'])
+    employment = int(selection_data['Employment'])
+    percent_establishments = int(selection_data['percent_establishments'])
+    percent_employment = int(selection_data['percent_employment'])
+    lost_wages_millions = selection_data['lost_wages_millions']
+    lost_sales_millions = selection_data['lost_sales_millions']
+
+    display_county = options['display_counties'][county]
+    header = f"Employment in {display_county} County, {state} inundation zones: {zone.lower()}"
+
+    stats_html = f"""
+    <div style='font-size: 18px;'>
+        <ul>
+            <li>In 2021, there were approximately <b>{establishments:,}</b> {display_county} County employers in a {zone.lower()} inundation zone.<br><i>(<b>{percent_establishments}%</b> of all employers in {display_county} County)</i></li>
+            <li><b>{employment:,}</b> people worked at those businesses.<br><i>(<b>{percent_employment}%</b> of all jobs in {display_county} County)</i></li>
+            <li>A one-week closure of establishments in this inundation zone would result in about <b>${lost_wages_millions:.1f} million</b> in lost wages and about <b>${lost_sales_millions:.1f} million</b> in lost business sales.</li>
+        </ul>
+    </div>
+    """
+
+    # --- Generate HTML for Industry Table ---
+    table_rows = []
+    industry_rows = zip(selection_data['industry_groups'], selection_data['industry_naics'], selection_data['industry_emp_percent'])
+    for i, (ind_group, naics_code, emp_percent) in enumerate(industry_rows, 1):
+        if pd.notna(ind_group):
+            table_rows.append(f"<tr><td>{i}</td><td>{naics_code}</td><td>{ind_group}</td><td><b>{emp_percent}%</b></td></tr>")
+    table_rows_html = "".join(table_rows)
+
+    table_html = f"""
+    <p style='font-size: 18px;'>The industry groups most affected by inundation in this zone would be:</p>
+    <table class="styled-table">
+        <thead>
+            <tr>
+                <th> </th>
+                <th>NAICS Code</th>
+                <th>Industry Group</th>
+                <th>% of Employment in the Inundation Zone</th>
+            </tr>
+        </thead>
+        <tbody>
+            {table_rows_html}
+        </tbody>
+    </table>
+    """
+
+    # Define image name once to use in the column and the dialog
+    state_abbreviations = {'Alabama': 'AL', 'Mississippi': 'MS'}
+    state_abbr = state_abbreviations.get(state, '')
+    slosh_cat_num = options['category_numbers'][zone]
+    image_name = f"{display_county}_{state_abbr}_cat{slosh_cat_num}.jpg"
+    map_caption = f"Inundation zone map for {display_county} County, {state} - {zone}"
+
+    return header, stats_html, table_html, image_name, map_caption
+
+@st.cache_resource
+def map_index():
+    """Returns the set of map image file names, scanning the map folder only once."""
+    try:
+        return frozenset(os.listdir(MAP_DIR))
+    except FileNotFoundError:
+        return frozenset()
+
+@st.cache_resource(max_entries=64)
+def load_map(image_name):
+    """Reads a map image from disk once and keeps its bytes in memory."""
+    with open(os.path.join(MAP_DIR, image_name), "rb") as f:
+        return f.read()
+
+@st.dialog("Inundation Map")
+def view_map_dialog(image_name):
+    """Displays the map image in a dialog."""
+    if image_name in map_index():
+        # Removed use_container_width to display the image at its actual size
+        st.image(load_map(image_name)) 
+    else:
+        st.error("Map image could not be found.")
+
+# --- Main Application ---
+def run_app(*, csv_path, title, subtitle):
+    """Runs the Streamlit app for one expected-losses spreadsheet."""
+
+    # --- Page Configuration ---
+    st.set_page_config(
+        page_title=title,
+        layout="wide"
+    )
+
+    st.title(title)
+    st.markdown(subtitle)
+
+    # Load data from the spreadsheet
+    df, options, _ = get_artifacts(csv_path)
+
+    if df is not None:
+        # --- User Selections ---
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            # State selection
+            states = options['states']
+            selected_state = st.selectbox("Select a State", [""] + states)
+
+        with col2:
+            # County selection (populated based on state)
+            if selected_state:
+                counties = options['counties'][selected_state]
+                selected_county = st.selectbox("Select a County", [""] + counties)
+            else:
+                st.selectbox("Select a County", [], disabled=True)
+                selected_county = None
+
+        with col3:
+            # Inundation type selection (populated based on state and county)
+            if selected_state and selected_county:
+                # The 'inundation_zone' column holds the user-friendly name
+                inundation_types = options['inundations'][(selected_state, selected_county)]
+                selected_inundation = st.selectbox("Select Inundation Type", [""] + inundation_types)
+            else:
+                st.selectbox("Select Inundation Type", [], disabled=True)
+                selected_inundation = None
+
+        st.divider()
+
+        # --- Display Results ---
+        if selected_state and selected_county and selected_inundation:
+            header, stats_html, table_html, image_name, map_caption = render_selection(csv_path, selected_state, selected_county, selected_inundation)
+
+            # --- Display Title ---
+            st.header(header)
+            
+            # --- Create columns for stats and map ---
+            stat_col, map_col = st.columns([3, 2]) # 60/40 split
+
+            with stat_col:
+                st.markdown(stats_html, unsafe_allow_html=True)
+                st.markdown(INDUSTRY_TABLE_STYLE, unsafe_allow_html=True)
+                st.markdown(table_html, unsafe_allow_html=True)
+
+            with map_col:
+                # --- Display Map ---
+                if image_name in map_index():
+                    st.image(load_map(image_name), caption=map_caption)
+                    
+                    # This button now calls the decorated dialog function directly
+                    if st.button("View Larger Map"):
+                        view_map_dialog(image_name)
+                else:
+                    image_path = os.path.join(MAP_DIR, image_name)
+                    st.warning(f"Map file not found at the expected path: {image_path}. Please ensure maps are in the 'Inundation Maps' folder.")
+            
+        else:
+            st.info("Please complete all selections above to view the analysis.")